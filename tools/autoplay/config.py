@@ -20,6 +20,12 @@ MOVE_RANGE = {INFANTRY: 4, RANGER: 3, TANK: 2}
 # Attack ranges
 ATTACK_RANGE = {INFANTRY: 1, RANGER: (2, 3), TANK: 1}
 
+# Same ranges as (min, max) for every unit type, so callers never branch on int vs tuple
+ATTACK_RANGE_NORM = {
+    unit_type: r if isinstance(r, tuple) else (r, r)
+    for unit_type, r in ATTACK_RANGE.items()
+}
+
 # Stats
 UNIT_ATK = {INFANTRY: 2, RANGER: 3, TANK: 4}
 UNIT_HP = {INFANTRY: 3, RANGER: 3, TANK: 5}
@@ -57,6 +63,10 @@ TERRAIN_DEFENSE = {
     TERRAIN_DIRT_ROAD: 0,
 }
 
+# Defense indexed by terrain ID (IDs are dense from 0), for hot loops: a list
+# index instead of a dict lookup per tile
+TERRAIN_DEFENSE_LUT = [TERRAIN_DEFENSE.get(t, 0) for t in range(max(TERRAIN_DEFENSE) + 1)]
+
 # Terrain type name -> ID mapping (from GraphQL string responses)
 TERRAIN_NAME_MAP = {
     "Grass": TERRAIN_GRASS,
@@ -1,8 +1,11 @@
 """Multicall JSON builder and transaction executor."""
 
 import json
+import os
+import shutil
 import subprocess
 import logging
+import tempfile
 import time
 
 from config import CONTRACT
@@ -12,12 +15,112 @@ from planner import (
 
 log = logging.getLogger("executor")
 
+# Module-level codec instances — skips per-call encoder/decoder construction
+# and emits compact JSON (the controller doesn't care about indentation).
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+_decoder = json.JSONDecoder()
 
-def encode_game_name(name: str) -> str:
-    """Encode a game name as ByteArray calldata: num_full_words,pending_word_hex,pending_len"""
-    # For names <= 31 chars (all ours), it's: 0,hex_felt,char_count
-    hex_str = "0x" + name.encode("ascii").hex()
-    return f"0,{hex_str},{len(name)}"
+# Resolve the controller binary once rather than searching PATH on every exec
+CONTROLLER_BIN = shutil.which("controller") or "controller"
+
+TURN_DIR = "/tmp/hashfront/autoplay"
+
+# Coordinates and unit ids are small ints — look their strings up instead of str()
+_SMALL_INT_STR = tuple(str(i) for i in range(256))
+
+
+def _int_str(v: int) -> str:
+    return _SMALL_INT_STR[v] if 0 <= v < 256 else str(v)
+
+
+def _extract_json_objects(output: str) -> list:
+    """Parse every top-level JSON object embedded in mixed CLI output.
+    raw_decode parses each object once and reports where it ended, so the
+    cursor jumps straight to the next '{' instead of walking every character.
+    """
+    json_objects = []
+    i = output.find("{")
+    while i != -1:
+        try:
+            obj, end = _decoder.raw_decode(output, i)
+        except json.JSONDecodeError:
+            i = output.find("{", i + 1)
+            continue
+        json_objects.append(obj)
+        i = output.find("{", end)
+    return json_objects
+
+
+def _last_json_object(output: str):
+    """Parse only the final top-level JSON object in output, or None.
+    Walks '{' candidates leftwards from the last '}' until one decodes to an
+    object that ends exactly there, so intermediate progress output is skipped.
+    """
+    # Fast path: controller --json frames each object on its own line
+    tail = output.rstrip()
+    line = tail[tail.rfind("\n") + 1:].strip()
+    if line.startswith("{") and line.endswith("}"):
+        try:
+            return _decoder.decode(line)
+        except json.JSONDecodeError:
+            pass  # not a single object (e.g. two on one line) — fall back
+
+    close = output.rfind("}")
+    if close == -1:
+        return None
+    i = output.rfind("{", 0, close)
+    while i != -1:
+        try:
+            obj, end = _decoder.raw_decode(output, i)
+            if end == close + 1:
+                return obj
+        except json.JSONDecodeError:
+            pass
+        i = output.rfind("{", 0, i)
+    return None
+
+
+# Per-entrypoint call templates; emitters only splice in the calldata
+_MOVE_CALL = {"contractAddress": CONTRACT, "entrypoint": "move_unit"}
+_ATTACK_CALL = {"contractAddress": CONTRACT, "entrypoint": "attack"}
+_CAPTURE_CALL = {"contractAddress": CONTRACT, "entrypoint": "capture"}
+_END_TURN_CALL = {"contractAddress": CONTRACT, "entrypoint": "end_turn"}
+
+
+def _emit_move(action, gid_s: str, calls: list):
+    path = action.path
+    # Fill a preallocated list in place: game_id, unit_id, len, x0, y0, x1, y1, ...
+    calldata = [None] * (3 + 2 * len(path))
+    calldata[0] = gid_s
+    calldata[1] = _int_str(action.unit_id)
+    calldata[2] = _int_str(len(path))
+    i = 3
+    for x, y in path:
+        calldata[i] = _int_str(x)
+        calldata[i + 1] = _int_str(y)
+        i += 2
+    calls.append({**_MOVE_CALL, "calldata": calldata})
+
+
+def _emit_attack(action, gid_s: str, calls: list):
+    calls.append({**_ATTACK_CALL, "calldata": [gid_s, _int_str(action.unit_id), _int_str(action.target_id)]})
+
+
+def _emit_capture(action, gid_s: str, calls: list):
+    calls.append({**_CAPTURE_CALL, "calldata": [gid_s, _int_str(action.unit_id)]})
+
+
+def _emit_end_turn(action, gid_s: str, calls: list):
+    calls.append({**_END_TURN_CALL, "calldata": [gid_s]})
+
+
+# Exact-type dispatch (one dict probe instead of an isinstance ladder).
+# CaptureAction is absent: captures are deferred to the end of the multicall.
+_EMIT = {
+    MoveAction: _emit_move,
+    AttackAction: _emit_attack,
+    EndTurnAction: _emit_end_turn,
+}
 
 
 def actions_to_calls(game_id: int, actions: list) -> list:
@@ -25,51 +128,29 @@ def actions_to_calls(game_id: int, actions: list) -> list:
     If a CaptureAction is present, it becomes the final call (no wait/end_turn after)
     since capturing HQ ends the game immediately.
     """
-    has_capture = any(isinstance(a, CaptureAction) for a in actions)
     calls = []
+    captures = []
+    end_turn_idx = []  # positions of end_turn calls, dropped if a capture follows
+    gid_s = str(game_id)
 
     for action in actions:
+        cls = type(action)
+        if cls is CaptureAction:
+            captures.append(action)
+            continue
+        if cls is EndTurnAction:
+            end_turn_idx.append(len(calls))
+        emit = _EMIT.get(cls)
+        if emit:
+            emit(action, gid_s, calls)
+
+    if captures:
         # Skip end_turn if capture present (game ends on capture)
-        if has_capture:
-            if isinstance(action, EndTurnAction):
-                continue
-        if isinstance(action, MoveAction):
-            path_flat = []
-            for x, y in action.path:
-                path_flat.extend([str(x), str(y)])
-            calldata = [str(game_id), str(action.unit_id), str(len(action.path))] + path_flat
-            calls.append({
-                "contractAddress": CONTRACT,
-                "entrypoint": "move_unit",
-                "calldata": calldata,
-            })
-
-        elif isinstance(action, AttackAction):
-            calls.append({
-                "contractAddress": CONTRACT,
-                "entrypoint": "attack",
-                "calldata": [str(game_id), str(action.unit_id), str(action.target_id)],
-            })
-
-        elif isinstance(action, CaptureAction):
-            # Capture is deferred to end of calls list (appended below)
-            pass
-
-        elif isinstance(action, EndTurnAction):
-            calls.append({
-                "contractAddress": CONTRACT,
-                "entrypoint": "end_turn",
-                "calldata": [str(game_id)],
-            })
-
-    # Append capture as the very last call (game ends on capture)
-    for action in actions:
-        if isinstance(action, CaptureAction):
-            calls.append({
-                "contractAddress": CONTRACT,
-                "entrypoint": "capture",
-                "calldata": [str(game_id), str(action.unit_id)],
-            })
+        for i in reversed(end_turn_idx):
+            del calls[i]
+        # Append capture as the very last call (game ends on capture)
+        for action in captures:
+            _emit_capture(action, gid_s, calls)
 
     return calls
 
@@ -79,58 +160,54 @@ def execute_calls(calls: list, label: str = "") -> dict:
     if not calls:
         return {"status": "skip", "message": "No calls"}
 
-    filepath = f"/tmp/hashfront/autoplay/_turn.json"
-    with open(filepath, "w") as f:
-        json.dump({"calls": calls}, f, indent=2)
+    # One file per call — game threads execute concurrently and must not
+    # overwrite each other's turn before the controller reads it
+    os.makedirs(TURN_DIR, exist_ok=True)
+    fd, filepath = tempfile.mkstemp(prefix="_turn_", suffix=".json", dir=TURN_DIR)
+    try:
+        os.write(fd, _encode_json({"calls": calls}).encode("utf-8"))
+    finally:
+        os.close(fd)
 
-    log.info(f"Executing {len(calls)} calls {label}")
+    log.info("Executing %s calls %s", len(calls), label)
 
     try:
         result = subprocess.run(
-            ["controller", "execute", "--file", filepath, "--json"],
-            capture_output=True, text=True, timeout=45,
+            [CONTROLLER_BIN, "execute", "--file", filepath, "--json"],
+            capture_output=True, timeout=45,
         )
     except subprocess.TimeoutExpired:
-        log.error(f"Transaction timed out {label}")
+        log.error("Transaction timed out %s", label)
         return {"status": "error", "message": "Timeout"}
+    finally:
+        os.unlink(filepath)
 
     # Parse output - controller outputs multiple JSON objects separated by newlines/braces
-    # Combine stdout and stderr since controller may write to either
-    output = (result.stdout or "") + (result.stderr or "")
-
-    # Extract all JSON objects from output
-    import re
-    json_objects = []
-    depth = 0
-    start = None
-    for i, ch in enumerate(output):
-        if ch == '{':
-            if depth == 0:
-                start = i
-            depth += 1
-        elif ch == '}':
-            depth -= 1
-            if depth == 0 and start is not None:
-                try:
-                    obj = json.loads(output[start:i+1])
-                    json_objects.append(obj)
-                except json.JSONDecodeError:
-                    pass
-                start = None
+    # Combine stdout and stderr since controller may write to either; join the
+    # raw bytes and decode once (tolerating stray non-UTF-8 bytes)
+    output = ((result.stdout or b"") + (result.stderr or b"")).decode("utf-8", errors="replace")
+
+    # The terminal status lives in the last object; only parse everything
+    # when that one doesn't carry a final status
+    last = _last_json_object(output)
+    if last is not None and last.get("status") in ("success", "error"):
+        json_objects = [last]
+    else:
+        json_objects = _extract_json_objects(output)
 
     # Look for success or error (check in reverse - last status matters)
     for data in reversed(json_objects):
         if data.get("status") == "success":
             tx_hash = data.get("data", {}).get("transaction_hash", "unknown")
-            log.info(f"✓ TX submitted: {tx_hash[:18]}... {label}")
+            log.info("✓ TX submitted: %s... %s", tx_hash[:18], label)
             return {"status": "success", "tx_hash": tx_hash}
         elif data.get("status") == "error":
             error_msg = data.get("message", "Unknown error")
-            log.error(f"✗ TX failed {label}: {error_msg[:500]}")
+            log.error("✗ TX failed %s: %s", label, error_msg[:500])
             return {"status": "error", "message": error_msg}
 
     if result.returncode != 0:
-        log.error(f"✗ Controller error {label}: {output[:200]}")
+        log.error("✗ Controller error %s: %s", label, output[:200])
         return {"status": "error", "message": output[:200]}
 
     return {"status": "unknown", "message": output[:200]}
@@ -143,23 +220,3 @@ def execute_turn(game_id: int, actions: list, label: str = "") -> dict:
 
     return result
 
-
-def create_game(name: str, map_id: int) -> dict:
-    """Create a new game in test mode as player 1."""
-    calldata = encode_game_name(name) + f",{map_id},1,1"
-    calls = [{
-        "contractAddress": CONTRACT,
-        "entrypoint": "create_game",
-        "calldata": calldata.split(","),
-    }]
-    return execute_calls(calls, f"[CREATE {name}]")
-
-
-def join_game(game_id: int, player_id: int = 2) -> dict:
-    """Join an existing game."""
-    calls = [{
-        "contractAddress": CONTRACT,
-        "entrypoint": "join_game",
-        "calldata": [str(game_id), str(player_id)],
-    }]
-    return execute_calls(calls, f"[JOIN game {game_id} as P{player_id}]")
@@ -4,7 +4,7 @@ Hashfront Autoplay — Threaded autonomous bot.
 
 Architecture:
   - Transactions execute directly per-thread (paymaster handles nonce management)
-  - GameThread: One per game, polls every GAME_POLL_INTERVAL, enqueues actions
+  - GameThread: One per game, polls every GAME_POLL_INTERVAL, submits its own multicall
   - ManagerThread: Discovers games, creates new ones, spawns/reaps GameThreads
 
 Usage:
@@ -20,15 +20,16 @@ import threading
 import time
 
 from config import (
-    MAX_GAMES, MAP_ID, GAME_NAMES, CONTRACT,
-    OPEN_GAME_PREFIX, OPEN_GAME_NAMES, BOT_ADDRESS,
+    MAX_GAMES, MAP_ID, GAME_NAMES, CONTRACT, TX_WAIT,
+    OPEN_GAME_PREFIX, OPEN_GAME_NAMES, BOT_ADDRESS, INFANTRY, RANGER,
 )
 from state import (
-    fetch_game_state, fetch_game_turn, fetch_game_counter, fetch_active_games,
-    fetch_all_games, fetch_player_states, fetch_map_ids,
+    fetch_game_state, fetch_game_turn, fetch_game_counter,
+    fetch_all_games, fetch_player_states_batch, fetch_map_ids,
 )
+from strategy import RUSH, ASSASSIN
 from planner import plan_turn, EndTurnAction, MoveAction, AttackAction, CaptureAction
-from executor import actions_to_calls, execute_calls, create_game, join_game
+from executor import actions_to_calls, execute_calls
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,9 +42,10 @@ log = logging.getLogger("main")
 GAME_POLL_INTERVAL = 5      # seconds — human games feel responsive
 SELFPLAY_POLL_INTERVAL = 3  # seconds — self-play can be slower
 MANAGER_INTERVAL = 30       # seconds — manager checks for new games
+MAP_LIST_TTL = 600          # seconds — how long the fetched map list is reused
 
 
-# ─── TX Queue ────────────────────────────────────────────────────────────────
+# ─── Transactions ────────────────────────────────────────────────────────────
 
 def tx_execute(calls: list, label: str) -> dict:
     """Execute calls directly. Each thread calls independently — paymaster handles nonces."""
@@ -53,9 +55,8 @@ def tx_execute(calls: list, label: str) -> dict:
 def wait_for_turn_change(game_id: int, prev_player: int, prev_round: int,
                          timeout: float = 10, interval: float = 0.3) -> bool:
     """Poll Torii until turn advances or game finishes. Returns True if changed."""
-    import time as _time
-    deadline = _time.monotonic() + timeout
-    while _time.monotonic() < deadline:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
             cp, rnd, st = fetch_game_turn(game_id)
             if st == "Finished":
@@ -64,10 +65,37 @@ def wait_for_turn_change(game_id: int, prev_player: int, prev_round: int,
                 return True
         except Exception:
             pass
-        _time.sleep(interval)
+        time.sleep(interval)
     return False  # timed out — proceed anyway
 
 
+def wait_for_indexer(predicate, timeout: float = 10, initial_delay: float = 0.2):
+    """
+    Poll predicate with exponential backoff (delay capped at TX_WAIT) until it
+    returns something truthy. Returns that value, or None on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, TX_WAIT)
+        try:
+            value = predicate()
+        except Exception:
+            continue
+        if value:
+            return value
+
+
+def _counter_above(prev: int) -> int:
+    """Current game counter if the indexer has moved past prev, else 0."""
+    count = fetch_game_counter()
+    return count if count > prev else 0
+
+
 # ─── Game Thread ─────────────────────────────────────────────────────────────
 
 class GameThread:
@@ -83,6 +111,7 @@ class GameThread:
         self.error_count = 0
         self.finished = False
         self.stop_event = threading.Event()
+        self.wake_event = threading.Event()  # set to run the next tick without waiting
         self._last_submitted = None  # (round, player) of last successful TX
         # Stalemate detection
         self._last_total_units = None  # total alive units last check
@@ -98,6 +127,7 @@ class GameThread:
 
     def stop(self):
         self.stop_event.set()
+        self.wake_event.set()
 
     def is_alive(self):
         return self._thread.is_alive()
@@ -109,29 +139,41 @@ class GameThread:
     def _run(self):
         glog = logging.getLogger(f"G{self.game_id}")
         mode = f"P{self.only_player} only" if self.only_player else "self-play"
-        glog.info(f"Started ({mode})")
+        glog.info("Started (%s)", mode)
 
         while not self.stop_event.is_set():
             try:
                 self._tick(glog)
             except Exception as e:
-                glog.error(f"Tick error: {e}")
+                glog.error("Tick error: %s", e)
                 self.error_count += 1
 
             if self.finished:
                 break
-            self.stop_event.wait(timeout=self.poll_interval)
+            self.wake_event.wait(timeout=self.poll_interval)
+            self.wake_event.clear()
 
         glog.info("Thread exiting")
 
     def _tick(self, glog):
+        # Poll just the turn fields first when this tick likely can't act — the
+        # human is moving, or our last TX hasn't been indexed yet — and only pull
+        # units/buildings once there's a turn for us to play (or the game ended)
+        if self.only_player or self._last_submitted:
+            cp, rnd, st = fetch_game_turn(self.game_id)
+            if st == "Playing" and self._last_submitted == (rnd, cp):
+                self._last_submitted = None  # clear after one skip so we don't deadlock
+                return
+            if self.only_player and st != "Finished" and (st != "Playing" or cp != self.only_player):
+                return
+
         state = fetch_game_state(self.game_id)
 
         # Check if game ended
         if state.info.state == "Finished":
             winner = state.info.winner
             prefix = "⚔️ " if self.only_player else ""
-            glog.info(f"{prefix}FINISHED — P{winner} wins at R{state.info.round}")
+            glog.info("%sFINISHED — P%s wins at R%s", prefix, winner, state.info.round)
             self.finished = True
             return
 
@@ -155,22 +197,21 @@ class GameThread:
 
         # Round 30+ — force resign to prevent infinite games
         if state.info.round >= 100:
-            glog.info(f"R{state.info.round} P{player}: round 100 reached, resigning 🏳️")
-            calls = [{"contractAddress": CONTRACT, "entrypoint": "resign", "calldata": [str(self.game_id)]}]
+            glog.info("R%s P%s: round 100 reached, resigning 🏳️", state.info.round, player)
+            calls = _resign_calls(self.game_id)
             tx_execute(calls, f"{label} RESIGN-R30")
             if self.only_player:
                 self.finished = True
             return
 
         # Check if we should resign: no units, or no enemies + no units that can capture
-        from config import INFANTRY, RANGER
         can_capture = any(u.unit_type in (INFANTRY, RANGER) for u in my_units)
         should_resign = (not my_units) or (not enemy_units and not can_capture)
 
         if should_resign:
             reason = "no units" if not my_units else "only tanks left, can't capture"
-            glog.info(f"R{state.info.round} P{player}: {reason}, resigning 🏳️")
-            calls = [{"contractAddress": CONTRACT, "entrypoint": "resign", "calldata": [str(self.game_id)]}]
+            glog.info("R%s P%s: %s, resigning 🏳️", state.info.round, player, reason)
+            calls = _resign_calls(self.game_id)
             tx_execute(calls, f"{label} RESIGN")
             if self.only_player:
                 self.finished = True
@@ -189,18 +230,16 @@ class GameThread:
 
         # Escalate strategy on stalemate
         if self._stale_rounds >= 6 and player not in self._stale_override:
-            from strategy import RUSH, ASSASSIN
-            import random as _rng
-            escalation = _rng.choice([RUSH, ASSASSIN])
+            escalation = random.choice([RUSH, ASSASSIN])
             self._stale_override[player] = escalation.name
-            glog.info(f"⚡ STALEMATE detected ({self._stale_rounds} stale rounds) — "
-                      f"P{player} escalating to {escalation.name}")
+            glog.info("⚡ STALEMATE detected (%s stale rounds) — P%s escalating to %s",
+                      self._stale_rounds, player, escalation.name)
 
         if self._stale_rounds >= 10:
             # 10+ stale ticks — force Rush on everyone, no going back
             self._stale_override[player] = "Rush"
             if self._stale_rounds == 10:
-                glog.info(f"⚡⚡ DEEP STALEMATE — P{player} forced Rush")
+                glog.info("⚡⚡ DEEP STALEMATE — P%s forced Rush", player)
 
         # Plan with optional strategy override
         strat_override = self._stale_override.get(player)
@@ -209,10 +248,10 @@ class GameThread:
         n_attacks = sum(1 for a in actions if isinstance(a, AttackAction))
         n_captures = sum(1 for a in actions if isinstance(a, CaptureAction))
         strat_tag = f" [{strat_override}]" if strat_override else ""
-        glog.info(f"R{state.info.round} P{player}: {len(my_units)}v{len(enemy_units)} — "
-                  f"{n_moves}M {n_attacks}A {n_captures}C{strat_tag}")
+        glog.info("R%s P%s: %sv%s — %sM %sA %sC%s", state.info.round, player,
+                  len(my_units), len(enemy_units), n_moves, n_attacks, n_captures, strat_tag)
 
-        # Execute via TX queue
+        # Whole turn goes out as one multicall — no queue, no inter-TX pause
         calls = actions_to_calls(self.game_id, actions)
         result = tx_execute(calls, label)
 
@@ -233,17 +272,21 @@ class GameThread:
                 return
 
             if self.error_count >= 3:
-                glog.warning(f"{self.error_count} consecutive errors — abandoning game")
+                glog.warning("%s consecutive errors — abandoning game", self.error_count)
                 self.finished = True
                 return
 
-            glog.warning(f"TX failed ({self.error_count}/3), will retry")
+            glog.warning("TX failed (%s/3), will retry", self.error_count)
         else:
             self.error_count = 0
             # Poll indexer until turn advances (instead of fixed sleep)
             changed = wait_for_turn_change(self.game_id, player, state.info.round)
             if changed:
                 self._last_submitted = None
+                # Self-play moves next too (or the game just ended) — tick
+                # straight away instead of sleeping out the poll interval
+                if not self.only_player:
+                    self.wake_event.set()
             else:
                 # Timeout — set guard but it'll expire after one skip
                 self._last_submitted = (state.info.round, player)
@@ -261,9 +304,16 @@ class Manager:
         self.max_games = max_games
         self.selfplay = selfplay
         self.available_maps: list = []
+        self.maps_fetched_at = float("-inf")  # monotonic time of last map list fetch
         self.game_threads: dict = {}  # {game_id: GameThread}
         self.known_finished: set = set()  # don't re-adopt finished games
+        self.open_lobby_ids: set = set()  # OPEN_* games waiting in Lobby (refreshed each tick)
+        # Precomputed name pools: self-play round-robins base names, suffixes shuffled
+        self.selfplay_names = _name_pool(GAME_NAMES)
+        self.open_names = _name_pool(OPEN_GAME_NAMES)
+        random.shuffle(self.open_names)
         self.game_name_idx = 0
+        self.open_name_idx = 0
         self.stats = {
             "games_created": 0,
             "turns_played": 0,
@@ -273,7 +323,8 @@ class Manager:
 
     def run(self):
         """Main loop — runs forever."""
-        log.info(f"Manager started | self-play={'ON' if self.selfplay else 'OFF'} | max_games={self.max_games}")
+        log.info("Manager started | self-play=%s | max_games=%s",
+                 "ON" if self.selfplay else "OFF", self.max_games)
 
         while True:
             try:
@@ -284,7 +335,7 @@ class Manager:
                     gt.stop()
                 break
             except Exception as e:
-                log.error(f"Manager error: {e}")
+                log.error("Manager error: %s", e)
 
             time.sleep(MANAGER_INTERVAL)
 
@@ -292,19 +343,36 @@ class Manager:
         # Reap finished threads
         self._reap()
 
+        # One Torii read of all games per tick, shared by discovery, the open-game
+        # check and creation
+        try:
+            all_games = fetch_all_games()
+        except Exception as e:
+            log.error("Discovery failed: %s", e)
+            return
+        # Classify each game once: Playing ones feed discovery and the creation
+        # cap, open lobbies feed the open-game check
+        active = []
+        open_lobby_ids = set()
+        for g in all_games:
+            if g.state == "Playing":
+                active.append(g)
+            elif g.state == "Lobby" and g.name.startswith(OPEN_GAME_PREFIX):
+                open_lobby_ids.add(g.game_id)
+        self.open_lobby_ids = open_lobby_ids
+
         # Discover new games
-        self._discover()
+        self._discover(active)
 
         # Ensure open game exists for humans
         self._ensure_open_game()
 
         # Create self-play games if under limit AND total active games < 10
         if self.selfplay:
-            active_games = fetch_active_games()
-            total_active = len(active_games)
+            total_active = len(active)
             selfplay_count = sum(1 for gt in self.game_threads.values() if not gt.only_player)
             if total_active >= 30:
-                log.debug(f"Skipping game creation: {total_active} active games (cap=30)")
+                log.debug("Skipping game creation: %s active games (cap=30)", total_active)
             else:
                 while selfplay_count < self.max_games and total_active < 30:
                     if not self._create_selfplay_game():
@@ -321,123 +389,134 @@ class Manager:
             gt = self.game_threads.pop(gid)
             self.known_finished.add(gid)
             self.stats["games_finished"] += 1
-            log.info(f"Reaped game {gid}")
+            log.info("Reaped game %s", gid)
 
-    def _discover(self):
+    def _discover(self, active: list):
         """Find active games that need threads."""
-        try:
-            active = fetch_active_games()
-        except Exception as e:
-            log.error(f"Discovery failed: {e}")
+        new_games = [
+            g for g in active
+            if g.game_id not in self.game_threads and g.game_id not in self.known_finished
+        ]
+        if not new_games:
             return
+        selfplay_count = sum(1 for gt in self.game_threads.values() if not gt.only_player)
+        # Resolve the bot's side for every new human game in a single query
+        bot_sides = self._detect_bot_sides(
+            [g.game_id for g in new_games if g.name.startswith(OPEN_GAME_PREFIX)]
+        )
 
-        for game in active:
-            if game.game_id in self.game_threads or game.game_id in self.known_finished:
-                continue
-
+        for game in new_games:
             if game.name.startswith(OPEN_GAME_PREFIX):
                 # Human game — detect bot side
-                bot_pid = self._detect_bot_side(game.game_id)
+                bot_pid = bot_sides.get(game.game_id, 0)
                 if bot_pid:
                     gt = GameThread(game.game_id, only_player=bot_pid)
                     gt.start()
                     self.game_threads[game.game_id] = gt
-                    log.info(f"⚔️ Human game {game.game_id} ({game.name}) — bot is P{bot_pid}")
+                    log.info("⚔️ Human game %s (%s) — bot is P%s", game.game_id, game.name, bot_pid)
             elif self.selfplay:
                 # Self-play game — only adopt if under limit
-                selfplay_count = sum(1 for gt in self.game_threads.values() if not gt.only_player)
                 if selfplay_count >= self.max_games:
                     continue
                 gt = GameThread(game.game_id, only_player=0)
                 gt.start()
                 self.game_threads[game.game_id] = gt
-                log.info(f"Adopted self-play game {game.game_id} ({game.name}) R{game.round}")
+                selfplay_count += 1
+                log.info("Adopted self-play game %s (%s) R%s", game.game_id, game.name, game.round)
 
-    def _detect_bot_side(self, game_id: int) -> int:
+    def _detect_bot_sides(self, game_ids: list) -> dict:
+        """Returns {game_id: bot player_id} for games where the bot faces a human."""
+        if not game_ids:
+            return {}
         try:
-            players = fetch_player_states(game_id)
-            bot_addr = BOT_ADDRESS.lower()
-            for pid, addr in players:
-                if addr.lower() == bot_addr:
-                    others = [a for p, a in players if p != pid]
-                    if others and others[0].lower() != bot_addr:
-                        return pid
-            return 0
+            players_by_game = fetch_player_states_batch(game_ids)
         except Exception as e:
-            log.error(f"Failed to detect bot side for game {game_id}: {e}")
-            return 0
+            log.error("Failed to detect bot side for games %s: %s", game_ids, e)
+            return {}
+        return {gid: _bot_side(players) for gid, players in players_by_game.items()}
 
     def _ensure_open_game(self):
+        if self.open_lobby_ids:
+            return
         try:
-            all_games = fetch_all_games()
-            open_in_lobby = [g for g in all_games if g.name.startswith(OPEN_GAME_PREFIX) and g.state == "Lobby"]
-            if open_in_lobby:
-                return
-
-            name = random.choice(OPEN_GAME_NAMES)
-            suffix = random.randint(100, 999)
-            name = f"{name}_{suffix}"
+            name = self.open_names[self.open_name_idx % len(self.open_names)]
+            self.open_name_idx += 1
             map_id = self._random_map()
-            log.info(f"🎮 Creating open game '{name}' on map {map_id}...")
+            prev_counter = fetch_game_counter()
+            log.info("🎮 Creating open game '%s' on map %s...", name, map_id)
             result = tx_execute(
                 _create_game_calls(name, map_id), f"CREATE {name}"
             )
             if result["status"] == "success":
-                time.sleep(3)  # wait for indexer to index new game
-                game_id = fetch_game_counter()
-                log.info(f"🎮 Open game {game_id} ({name}) — waiting for challengers!")
+                # Wait for indexer to index new game
+                game_id = wait_for_indexer(lambda: _counter_above(prev_counter))
+                if not game_id:
+                    # Don't guess an id — next tick's lobby scan picks the game up once indexed
+                    log.error("Indexer did not show open game '%s' in time", name)
+                    return
+                self.open_lobby_ids.add(game_id)
+                log.info("🎮 Open game %s (%s) — waiting for challengers!", game_id, name)
             else:
-                log.error(f"Failed to create open game: {result.get('message', '')[:100]}")
+                log.error("Failed to create open game: %s", result.get("message", "")[:100])
         except Exception as e:
-            log.error(f"Open game error: {e}")
+            log.error("Open game error: %s", e)
 
     def _create_selfplay_game(self) -> bool:
-        name = GAME_NAMES[self.game_name_idx % len(GAME_NAMES)]
-        suffix = random.randint(100, 999)
-        name = f"{name}_{suffix}"
+        name = self.selfplay_names[self.game_name_idx % len(self.selfplay_names)]
         self.game_name_idx += 1
         map_id = self._random_map()
 
-        log.info(f"Creating self-play '{name}' on map {map_id}...")
+        try:
+            prev_counter = fetch_game_counter()
+        except Exception as e:
+            log.error("Failed to fetch counter: %s", e)
+            return False
+
+        log.info("Creating self-play '%s' on map %s...", name, map_id)
         result = tx_execute(
             _create_game_calls(name, map_id), f"CREATE {name}"
         )
         if result["status"] != "success":
-            log.error(f"Failed to create: {result.get('message', '')[:100]}")
+            log.error("Failed to create: %s", result.get("message", "")[:100])
             return False
 
-        time.sleep(3)  # wait for indexer to index new game
-        try:
-            game_id = fetch_game_counter()
-        except Exception as e:
-            log.error(f"Failed to fetch counter: {e}")
+        # Wait for indexer to index new game
+        game_id = wait_for_indexer(lambda: _counter_above(prev_counter))
+        if not game_id:
+            # The stale counter may be another game (e.g. the open lobby just
+            # created) — never join a guessed id
+            log.error("Indexer did not show game '%s' in time, not joining", name)
             return False
 
-        log.info(f"Joining game {game_id} as P2...")
+        log.info("Joining game %s as P2...", game_id)
         result = tx_execute(
             _join_game_calls(game_id, 2), f"JOIN game {game_id} as P2"
         )
         if result["status"] != "success":
-            log.error(f"Failed to join: {result.get('message', '')[:100]}")
+            log.error("Failed to join: %s", result.get("message", "")[:100])
             return False
 
-        time.sleep(3)  # wait for indexer to index new game
+        # Wait for indexer to see the game start (thread polls regardless on timeout)
+        wait_for_indexer(lambda: fetch_game_turn(game_id)[2] == "Playing", timeout=3)
 
         gt = GameThread(game_id, only_player=0)
         gt.start()
         self.game_threads[game_id] = gt
         self.stats["games_created"] += 1
-        log.info(f"✓ Self-play game {game_id} on map {map_id}")
+        log.info("✓ Self-play game %s on map %s", game_id, map_id)
         return True
 
     def _random_map(self) -> int:
-        if not self.available_maps:
+        # Map list changes rarely — refresh it on a TTL, and let a failed fetch
+        # wait out the same TTL instead of hitting Torii on every create
+        now = time.monotonic()
+        if now - self.maps_fetched_at >= MAP_LIST_TTL:
+            self.maps_fetched_at = now
             try:
-                self.available_maps = fetch_map_ids()
-                log.info(f"Loaded {len(self.available_maps)} maps")
+                self.available_maps = fetch_map_ids() or self.available_maps
+                log.info("Loaded %s maps", len(self.available_maps))
             except Exception as e:
-                log.error(f"Failed to fetch maps: {e}")
-                return MAP_ID
+                log.error("Failed to fetch maps: %s", e)
         return random.choice(self.available_maps) if self.available_maps else MAP_ID
 
     def _log_stats(self):
@@ -445,35 +524,50 @@ class Manager:
         human = sum(1 for gt in self.game_threads.values() if gt.only_player)
         s = self.stats
         log.info(
-            f"Threads: {selfplay} self-play | {human} vs human | "
-            f"{s['games_created']} created | {s['games_finished']} finished | "
-            f"{s['errors']} errors"
+            "Threads: %s self-play | %s vs human | %s created | %s finished | %s errors",
+            selfplay, human, s["games_created"], s["games_finished"], s["errors"],
         )
 
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
-def _encode_game_name(name: str) -> str:
-    hex_str = "0x" + name.encode("ascii").hex()
-    return f"0,{hex_str},{len(name)}"
+def _name_pool(bases: list) -> list:
+    """All '<base>_<100..999>' names, grouped by shuffled suffix so consecutive
+    picks cycle through the base names."""
+    suffixes = list(range(100, 1000))
+    random.shuffle(suffixes)
+    return [f"{base}_{suffix}" for suffix in suffixes for base in bases]
+
+
+def _bot_side(players: list) -> int:
+    """Bot's player_id in a game against someone else, or 0."""
+    bot_addr = BOT_ADDRESS.lower()
+    for pid, addr in players:
+        if addr.lower() == bot_addr:
+            others = [a for p, a in players if p != pid]
+            if others and others[0].lower() != bot_addr:
+                return pid
+    return 0
+
+
+_CREATE_GAME_CALL = {"contractAddress": CONTRACT, "entrypoint": "create_game"}
+_JOIN_GAME_CALL = {"contractAddress": CONTRACT, "entrypoint": "join_game"}
+_RESIGN_CALL = {"contractAddress": CONTRACT, "entrypoint": "resign"}
 
 
 def _create_game_calls(name: str, map_id: int) -> list:
-    parts = _encode_game_name(name).split(",")
-    calldata = parts + [str(map_id), "1", "1"]  # map_id, test_mode=1, ?=1
-    return [{
-        "contractAddress": CONTRACT,
-        "entrypoint": "create_game",
-        "calldata": calldata,
-    }]
+    # Name as ByteArray (all ours are <= 31 chars): 0 full words, pending word, pending len
+    calldata = ["0", "0x" + name.encode("ascii").hex(), str(len(name)),
+                str(map_id), "1", "1"]  # map_id, test_mode=1, ?=1
+    return [{**_CREATE_GAME_CALL, "calldata": calldata}]
 
 
 def _join_game_calls(game_id: int, player_id: int) -> list:
-    return [{
-        "contractAddress": CONTRACT,
-        "entrypoint": "join_game",
-        "calldata": [str(game_id), str(player_id)],
-    }]
+    return [{**_JOIN_GAME_CALL, "calldata": [str(game_id), str(player_id)]}]
+
+
+def _resign_calls(game_id: int) -> list:
+    return [{**_RESIGN_CALL, "calldata": [str(game_id)]}]
 
 
 # ─── Entry Point ─────────────────────────────────────────────────────────────
@@ -485,8 +579,9 @@ def main():
     args = parser.parse_args()
 
     log.info("=== Hashfront Autoplay Bot (threaded) ===")
-    log.info(f"Self-play: {'OFF' if args.no_selfplay else f'ON (max {args.games})'}")
-    log.info(f"Human poll: {GAME_POLL_INTERVAL}s | Self-play poll: {SELFPLAY_POLL_INTERVAL}s | Manager: {MANAGER_INTERVAL}s")
+    log.info("Self-play: %s", "OFF" if args.no_selfplay else f"ON (max {args.games})")
+    log.info("Human poll: %ss | Self-play poll: %ss | Manager: %ss",
+             GAME_POLL_INTERVAL, SELFPLAY_POLL_INTERVAL, MANAGER_INTERVAL)
 
     manager = Manager(
         max_games=args.games,
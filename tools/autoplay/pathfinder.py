@@ -11,14 +11,26 @@ def manhattan(a: tuple, b: tuple) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
+_DXDY = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
 def neighbors(x: int, y: int, width: int = 20, height: int = 20):
     """Yield adjacent tiles (up/down/left/right)."""
-    for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+    for dx, dy in _DXDY:
         nx, ny = x + dx, y + dy
         if 0 <= nx < width and 0 <= ny < height:
             yield nx, ny
 
 
+# Adjacent tiles of every position on the 20x20 board, indexed [y * 20 + x],
+# as ((nx, ny), ny * 20 + nx) pairs. The searches iterate these prebuilt tuples
+# instead of a generator per pop, and use the flat index for table lookups.
+_ADJACENT = tuple(
+    tuple(((nx, ny), ny * 20 + nx) for nx, ny in neighbors(x, y))
+    for y in range(20) for x in range(20)
+)
+
+
 def move_cost(terrain: int, unit_type: str):
     """Get movement cost for a unit type on a terrain. Returns None if impassable."""
     if terrain == TERRAIN_MOUNTAIN:
@@ -28,54 +40,210 @@ def move_cost(terrain: int, unit_type: str):
     return TERRAIN_COST.get(terrain, 1)
 
 
+def grid_cached(cache: dict, grid, key, build, max_size: int):
+    """
+    Return build() memoized in cache under (id(grid), key).
+    Terrain grids are cached per map and never mutated, so grid identity stands
+    in for its contents. Each entry holds grid itself, which keeps its id from
+    being reused by another grid while cached. The cache is cleared once it
+    holds max_size entries. Cached values are shared — treat them as read-only.
+    """
+    cache_key = (id(grid), key)
+    hit = cache.get(cache_key)
+    if hit is not None and hit[0] is grid:
+        return hit[1]
+    value = build()
+    if len(cache) >= max_size:
+        cache.clear()
+    cache[cache_key] = (grid, value)
+    return value
+
+
+# Flat per-unit-type step costs (each map's grid is converted once per unit type)
+_step_cost_cache: dict = {}
+_STEP_COST_CACHE_MAX = 256
+
+
+def step_costs(grid, unit_type: str) -> list:
+    """Row-major step cost of every tile for unit_type: costs[y * width + x], None if impassable."""
+    return grid_cached(
+        _step_cost_cache, grid, unit_type,
+        lambda: [move_cost(terrain, unit_type) for row in grid for terrain in row],
+        _STEP_COST_CACHE_MAX,
+    )
+
+
+# Goal distance fields from full_path_distance. Many units head for the same
+# HQ/building every turn, and terrain never changes within a map.
+_distance_cache: dict = {}
+_DISTANCE_CACHE_MAX = 2048
+
+# find_reachable results, keyed by the units near the start rather than the
+# whole occupied set — units that hold position or stand in the same local
+# formation from turn to turn repeat the same search.
+_reach_cache: dict = {}
+_REACH_CACHE_MAX = 4096
+
+
 def find_reachable(grid, start: tuple, unit_type: str, occupied: set, max_range: int = None):
     """
     Dijkstra from start, returning all reachable tiles within move range.
-    Returns dict: (x, y) -> (cost, path) where path is list of (x, y) steps.
+    Returns dict: (x, y) -> (cost, parent) where parent is the previous tile on
+    the cheapest path (None for start); rebuild a chosen tile's path with path_to.
     Occupied tiles block transit AND destination.
+    The result is cached — treat it as read-only.
     """
     if max_range is None:
         max_range = MOVE_RANGE[unit_type]
 
-    open_set = [(0, start, [])]
-    best = {}
+    # Every step costs at least 1, so only units within max_range can affect the search
+    x, y = start
+    blockers = frozenset([
+        pos for pos in occupied
+        if abs(pos[0] - x) + abs(pos[1] - y) <= max_range and pos != start
+    ])
+    return grid_cached(
+        _reach_cache, grid, (start, unit_type, max_range, blockers),
+        lambda: _reachable(grid, start, unit_type, blockers, max_range),
+        _REACH_CACHE_MAX,
+    )
+
+
+def _reachable(grid, start: tuple, unit_type: str, blockers: frozenset, max_range: int) -> dict:
+    """Uncached find_reachable, with occupied already narrowed to blockers."""
+    x, y = start
+    if (not blockers and max_range <= _OPEN_DISK_MAX_RANGE
+            and open_disk_starts(grid, unit_type, max_range)[y * 20 + x]):
+        # Nothing in the way: shift the precomputed open-terrain result
+        best = {start: (0, None)}
+        for dx, dy, cost, pdx, pdy in _open_disk(max_range):
+            best[(x + dx, y + dy)] = (cost, (x + pdx, y + pdy))
+    else:
+        best = _search(step_costs(grid, unit_type), start, blockers, max_range)
+    return best
 
-    while open_set:
-        cost, pos, path = heapq.heappop(open_set)
-        if pos in best:
-            continue
-        best[pos] = (cost, path)
 
-        if cost >= max_range:
-            continue
+def _search(steps: list, start: tuple, occupied: set, max_range: int) -> dict:
+    """Bucket-queue Dijkstra behind find_reachable."""
+    # Step costs are small positive ints, so a bucket per cost replaces the heap.
+    # Tiles only carry (cost, parent) — no per-tile path lists are built.
+    buckets = [[] for _ in range(max_range + 1)]
+    frontier = {start: (0, None)}
+    buckets[0].append(start)
+    best = {}
 
-        for nx, ny in neighbors(pos[0], pos[1]):
-            npos = (nx, ny)
-            if npos in best:
+    for cost, bucket in enumerate(buckets):
+        # Settle in position order (same tie-break as heap ordering on (cost, pos))
+        bucket.sort()
+        for pos in bucket:
+            if pos in best:
                 continue
-            terrain = grid[ny][nx]
-            step = move_cost(terrain, unit_type)
-            if step is None:
-                continue
-            new_cost = cost + step
-            if new_cost > max_range:
-                continue
-            # Occupied tiles block movement
-            if npos in occupied:
+            entry = frontier[pos]
+            if entry[0] != cost:
+                continue  # stale entry, tile was reached cheaper
+            best[pos] = entry
+
+            if cost >= max_range:
                 continue
-            new_path = path + [npos]
-            heapq.heappush(open_set, (new_cost, npos, new_path))
+
+            for npos, idx in _ADJACENT[pos[1] * 20 + pos[0]]:
+                if npos in best:
+                    continue
+                step = steps[idx]
+                if step is None:
+                    continue
+                new_cost = cost + step
+                if new_cost > max_range:
+                    continue
+                # Occupied tiles block movement
+                if npos in occupied:
+                    continue
+                seen = frontier.get(npos)
+                if seen is None or new_cost < seen[0]:
+                    frontier[npos] = (new_cost, pos)
+                    buckets[new_cost].append(npos)
+                elif new_cost == seen[0] and path_to(best, pos) + [npos] < path_to(best, seen[1]) + [npos]:
+                    # Equal-cost tie: keep the lexicographically smaller path
+                    frontier[npos] = (new_cost, pos)
 
     return best
 
 
+# Open-terrain fast path. When a start's whole move disk lies on the board,
+# costs 1 per tile and holds no other unit, the search result is the same for
+# every such start up to translation (ties compare positions and paths, which
+# shifting preserves), so it is computed once per range and shifted.
+_OPEN_DISK_MAX_RANGE = 9  # largest disk that fits on the 20x20 board
+_open_disk_cache: dict = {}
+_open_start_cache: dict = {}
+_OPEN_START_CACHE_MAX = 256
+
+
+def _open_disk(max_range: int) -> list:
+    """Search result on open terrain as (dx, dy, cost, parent_dx, parent_dy), start excluded."""
+    disk = _open_disk_cache.get(max_range)
+    if disk is None:
+        c = max_range
+        reachable = _search([1] * 400, (c, c), set(), max_range)
+        disk = [
+            (x - c, y - c, cost, parent[0] - c, parent[1] - c)
+            for (x, y), (cost, parent) in reachable.items() if parent is not None
+        ]
+        _open_disk_cache[max_range] = disk
+    return disk
+
+
+def open_disk_starts(grid, unit_type: str, max_range: int) -> list:
+    """Row-major flags: True where a max_range move disk around the tile is in bounds and all cost 1."""
+    return grid_cached(
+        _open_start_cache, grid, (unit_type, max_range),
+        lambda: _open_starts(grid, unit_type, max_range),
+        _OPEN_START_CACHE_MAX,
+    )
+
+
+def _open_starts(grid, unit_type: str, max_range: int) -> list:
+    steps = step_costs(grid, unit_type)
+    r = max_range
+    offsets = [dy * 20 + dx for dx, dy, _, _, _ in _open_disk(r)]
+    flags = [False] * 400
+    for y in range(r, 20 - r):
+        for x in range(r, 20 - r):
+            base = y * 20 + x
+            flags[base] = all(steps[base + o] == 1 for o in offsets)
+    return flags
+
+
+def path_to(reachable: dict, tile: tuple) -> list:
+    """Steps from the search start to tile (excluding start) using find_reachable's parents."""
+    path = []
+    prev = reachable[tile][1]
+    while prev is not None:
+        path.append(tile)
+        tile = prev
+        prev = reachable[tile][1]
+    path.reverse()
+    return path
+
+
 def full_path_distance(grid, start: tuple, goal: tuple, unit_type: str):
     """
     BFS/Dijkstra ignoring move range and occupancy to find true path distance.
     Returns dict of {tile: true_distance_to_goal} for tiles reachable from goal.
     This is used to pick the best direction when Manhattan distance is misleading
     (e.g., routing around mountain bands).
+    The result depends only on (grid, goal, unit_type) and is cached — treat it as read-only.
     """
+    return grid_cached(
+        _distance_cache, grid, (goal, unit_type),
+        lambda: _distance_field(grid, goal, unit_type),
+        _DISTANCE_CACHE_MAX,
+    )
+
+
+def _distance_field(grid, goal: tuple, unit_type: str) -> dict:
+    steps = step_costs(grid, unit_type)
+
     # Reverse Dijkstra from goal
     open_set = [(0, goal)]
     dist = {}
@@ -84,27 +252,28 @@ def full_path_distance(grid, start: tuple, goal: tuple, unit_type: str):
         if pos in dist:
             continue
         dist[pos] = cost
-        for nx, ny in neighbors(pos[0], pos[1]):
-            npos = (nx, ny)
+        for npos, idx in _ADJACENT[pos[1] * 20 + pos[0]]:
             if npos in dist:
                 continue
-            terrain = grid[ny][nx]
-            step = move_cost(terrain, unit_type)
+            step = steps[idx]
             if step is None:
                 continue
             heapq.heappush(open_set, (cost + step, npos))
     return dist
 
 
-def best_move_toward(grid, start: tuple, goal: tuple, unit_type: str, occupied: set):
+def best_move_toward(grid, start: tuple, goal: tuple, unit_type: str, occupied: set,
+                     reachable: dict = None):
     """
     Find the best reachable tile toward goal. Returns path (list of (x,y) steps).
     Uses true path distance (not Manhattan) to handle routing around obstacles.
+    Pass reachable when the caller already ran find_reachable with the same arguments.
     """
-    reachable = find_reachable(grid, start, unit_type, occupied)
+    if reachable is None:
+        reachable = find_reachable(grid, start, unit_type, occupied)
 
-    if goal in reachable and reachable[goal][1]:
-        return reachable[goal][1]
+    if goal in reachable and goal != start:
+        return path_to(reachable, goal)
 
     # Use true path distance from each reachable tile to goal
     true_dist = full_path_distance(grid, start, goal, unit_type)
@@ -116,8 +285,8 @@ def best_move_toward(grid, start: tuple, goal: tuple, unit_type: str, occupied:
     best_tile = None
     best_dist = start_dist
 
-    for tile, (cost, path) in reachable.items():
-        if tile == start or not path:
+    for tile in reachable:
+        if tile == start:
             continue
         d = true_dist.get(tile, float('inf'))
         if d < best_dist:
@@ -126,7 +295,7 @@ def best_move_toward(grid, start: tuple, goal: tuple, unit_type: str, occupied:
 
     if best_tile is None:
         return []  # stuck - can't move anywhere useful
-    return reachable[best_tile][1]
+    return path_to(reachable, best_tile)
 
 
 def find_attack_position(grid, unit_pos: tuple, target_pos: tuple, unit_type: str,
@@ -135,51 +304,44 @@ def find_attack_position(grid, unit_pos: tuple, target_pos: tuple, unit_type: st
     Find a reachable tile from which the unit can attack the target.
     Returns path to that tile, or [] if unit is already in range, or None if unreachable.
     """
-    # Check if already in range
-    dist = manhattan(unit_pos, target_pos)
+    # Accept a bare int range as (r, r), once, so the tile loop doesn't branch
     if isinstance(attack_range, tuple):
         min_r, max_r = attack_range
-        if min_r <= dist <= max_r:
-            return []  # already in position
     else:
-        if dist == attack_range:
-            return []
+        min_r = max_r = attack_range
+
+    # Check if already in range
+    if min_r <= manhattan(unit_pos, target_pos) <= max_r:
+        return []  # already in position
 
     # Find reachable tiles that are in attack range of target
     reachable = find_reachable(grid, unit_pos, unit_type, occupied)
 
     candidates = []
-    for tile, (cost, path) in reachable.items():
-        if tile == unit_pos and not path:
+    for tile, (cost, _) in reachable.items():
+        if tile == unit_pos:
             continue
-        d = manhattan(tile, target_pos)
-        if isinstance(attack_range, tuple):
-            min_r, max_r = attack_range
-            if min_r <= d <= max_r:
-                candidates.append((cost, tile, path))
-        else:
-            if d == attack_range:
-                candidates.append((cost, tile, path))
+        if min_r <= manhattan(tile, target_pos) <= max_r:
+            candidates.append((cost, tile))
 
     if not candidates:
         return None  # can't reach attack position this turn
 
     # Pick cheapest (least movement used)
-    candidates.sort()
-    return candidates[0][2]
+    return path_to(reachable, min(candidates)[1])
 
 
-def find_adjacent_to(grid, target: tuple, unit_type: str, start: tuple, occupied: set):
+def find_adjacent_to(grid, target: tuple, unit_type: str, start: tuple, occupied: set,
+                     reachable: dict = None):
     """Find best reachable tile adjacent to target. For melee units."""
-    reachable = find_reachable(grid, start, unit_type, occupied)
+    if reachable is None:
+        reachable = find_reachable(grid, start, unit_type, occupied)
     candidates = []
     for nx, ny in neighbors(target[0], target[1]):
         npos = (nx, ny)
-        if npos in reachable and reachable[npos][1]:
-            cost, path = reachable[npos]
-            candidates.append((cost, npos, path))
+        if npos in reachable and npos != start:
+            candidates.append((reachable[npos][0], npos))
 
     if not candidates:
         return None
-    candidates.sort()
-    return candidates[0][2]
+    return path_to(reachable, min(candidates)[1])
@@ -5,79 +5,118 @@ from dataclasses import dataclass
 from typing import Optional
 
 from config import (
-    INFANTRY, RANGER, TANK, MOVE_RANGE, ATTACK_RANGE,
-    UNIT_ATK, UNIT_HP, TERRAIN_DEFENSE,
+    INFANTRY, RANGER, TANK, MOVE_RANGE, ATTACK_RANGE_NORM,
+    UNIT_ATK, UNIT_HP, TERRAIN_DEFENSE_LUT,
 )
 from state import GameState, Unit
 from pathfinder import (
-    manhattan, neighbors, find_reachable, best_move_toward,
+    manhattan, neighbors, find_reachable, path_to, best_move_toward,
     find_attack_position, find_adjacent_to, move_cost,
-    full_path_distance,
+    full_path_distance, grid_cached,
 )
-from strategy import Strategy, pick_strategy_adaptive
+from strategy import Strategy, ALL_STRATEGIES, pick_strategy_adaptive
 
 log = logging.getLogger("planner")
 
 # ── Action dataclasses ──────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveAction:
     unit_id: int
     path: list
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttackAction:
     unit_id: int
     target_id: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaptureAction:
     unit_id: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EndTurnAction:
     pass
 
 
 # ── Threat / danger map ────────────────────────────────────────────
 
-def build_danger_map(game_state: GameState, enemies: list) -> dict:
+_MAX_DEFENSE = max(TERRAIN_DEFENSE_LUT)
+
+
+def _attack_offsets(min_r: int, max_r: int) -> tuple:
+    """(dx, dy) offsets at Manhattan distance min_r..max_r."""
+    return tuple(
+        (dx, dy)
+        for dx in range(-max_r, max_r + 1)
+        for dy in range(-max_r, max_r + 1)
+        if min_r <= abs(dx) + abs(dy) <= max_r
+    )
+
+
+# Attack-range offsets per unit type, built once instead of rescanning the square per tile
+_ATK_OFFSETS = {unit_type: _attack_offsets(*r) for unit_type, r in ATTACK_RANGE_NORM.items()}
+
+# Damage a unit type deals to a defender on each tile, per map grid:
+# dmg[y * 20 + x] = max(atk - defense, 1)
+_damage_table_cache: dict = {}
+_DAMAGE_TABLE_CACHE_MAX = 256
+
+
+def _damage_table(grid, unit_type: str) -> list:
+    """Row-major damage unit_type deals to a unit on each tile of grid. Cached."""
+    atk = UNIT_ATK[unit_type]
+    return grid_cached(
+        _damage_table_cache, grid, unit_type,
+        lambda: [max(atk - TERRAIN_DEFENSE_LUT[terrain], 1) for row in grid for terrain in row],
+        _DAMAGE_TABLE_CACHE_MAX,
+    )
+
+
+# Per-enemy danger stamps keyed by (grid, position, unit type). A stamp ignores
+# occupancy, so it only changes when that enemy moves — each turn just re-sums
+# cached stamps and recomputes the ones for enemies that moved.
+_danger_stamp_cache: dict = {}
+_DANGER_STAMP_CACHE_MAX = 4096
+
+
+def _enemy_danger_stamp(grid, epos: tuple, unit_type: str) -> tuple:
+    """((y * 20 + x, damage), ...) one enemy at epos could deal next turn. Cached."""
+    return grid_cached(
+        _danger_stamp_cache, grid, (epos, unit_type),
+        lambda: _build_danger_stamp(grid, epos, unit_type),
+        _DANGER_STAMP_CACHE_MAX,
+    )
+
+
+def _build_danger_stamp(grid, epos: tuple, unit_type: str) -> tuple:
+    stamp = {}
+    damage = _damage_table(grid, unit_type)
+    offsets = _ATK_OFFSETS[unit_type]
+    reachable = find_reachable(grid, epos, unit_type, set())
+    for x0, y0 in reachable:
+        for dx, dy in offsets:
+            tx, ty = x0 + dx, y0 + dy
+            if not (0 <= tx < 20 and 0 <= ty < 20):
+                continue
+            idx = ty * 20 + tx
+            stamp[idx] = stamp.get(idx, 0) + damage[idx]
+    return tuple(stamp.items())
+
+
+def build_danger_map(game_state: GameState, enemies: list) -> list:
     """
     For each tile, compute total damage enemies could deal next turn.
-    Returns {(x,y): total_potential_damage}.
+    Returns a dense row-major list: danger[y * 20 + x] = total_potential_damage.
     """
-    danger = {}
+    danger = [0] * 400
     grid = game_state.grid
     for enemy in enemies:
-        epos = (enemy.x, enemy.y)
-        atk = UNIT_ATK[enemy.unit_type]
-        a_range = ATTACK_RANGE[enemy.unit_type]
-        reachable = find_reachable(grid, epos, enemy.unit_type, set())
-        for tile in reachable:
-            for tx, ty in _tiles_in_attack_range(tile, a_range, 20, 20):
-                tpos = (tx, ty)
-                terrain = grid[ty][tx]
-                defense = TERRAIN_DEFENSE.get(terrain, 0)
-                dmg = max(atk - defense, 1)
-                danger[tpos] = danger.get(tpos, 0) + dmg
+        for idx, dmg in _enemy_danger_stamp(grid, (enemy.x, enemy.y), enemy.unit_type):
+            danger[idx] += dmg
     return danger
 
 
-def _tiles_in_attack_range(pos, a_range, w, h):
-    if isinstance(a_range, tuple):
-        min_r, max_r = a_range
-    else:
-        min_r, max_r = a_range, a_range
-    x0, y0 = pos
-    for dx in range(-max_r, max_r + 1):
-        for dy in range(-max_r, max_r + 1):
-            d = abs(dx) + abs(dy)
-            if min_r <= d <= max_r:
-                nx, ny = x0 + dx, y0 + dy
-                if 0 <= nx < w and 0 <= ny < h:
-                    yield nx, ny
-
-
 # ── Focus fire target ordering ─────────────────────────────────────
 
 def _assign_focus_targets(my_units, enemies, game_state, strat: Strategy):
@@ -88,16 +127,17 @@ def _assign_focus_targets(my_units, enemies, game_state, strat: Strategy):
     if not enemies:
         return []
 
-    cx = sum(u.x for u in my_units) / len(my_units)
-    cy = sum(u.y for u in my_units) / len(my_units)
+    # Coordinates are non-negative, so floor division matches int() of the mean
+    cx = sum(u.x for u in my_units) // len(my_units)
+    cy = sum(u.y for u in my_units) // len(my_units)
+    # High focus_fire → HP dominates. Low → distance matters more.
+    hp_weight = 10 * strat.focus_fire
+    dist_weight = 5 * (1 - strat.focus_fire)
 
     scored = []
     for e in enemies:
         threat = UNIT_ATK[e.unit_type]
-        dist = manhattan((e.x, e.y), (int(cx), int(cy)))
-        # High focus_fire → HP dominates. Low → distance matters more.
-        hp_weight = 10 * strat.focus_fire
-        dist_weight = 5 * (1 - strat.focus_fire)
+        dist = abs(e.x - cx) + abs(e.y - cy)
         score = e.hp * hp_weight + dist * dist_weight - threat * 2
         scored.append((score, e.unit_id, e))
     scored.sort()
@@ -149,7 +189,6 @@ def plan_turn(game_state: GameState, player_id: int, strategy_override: str = No
 
     # Pick strategy — override if stalemate escalation is active
     if strategy_override:
-        from strategy import ALL_STRATEGIES
         strat = next((s for s in ALL_STRATEGIES if s.name == strategy_override), None)
         if not strat:
             strat = pick_strategy_adaptive(game_state, player_id)
@@ -159,19 +198,24 @@ def plan_turn(game_state: GameState, player_id: int, strategy_override: str = No
     if not enemies:
         # No enemies — capture march (all strategies agree here)
         if enemy_hq:
-            actionable.sort(key=lambda u: manhattan((u.x, u.y), enemy_hq))
+            hx, hy = enemy_hq
+            actionable.sort(key=lambda u: abs(u.x - hx) + abs(u.y - hy))
         for unit in actionable:
             unit_pos = (unit.x, unit.y)
+            occupied.discard(unit_pos)  # a unit never blocks its own move
             a, new_pos = _plan_capture_march(unit, unit_pos, enemy_hq, game_state, occupied)
             actions.extend(a)
-            if new_pos != unit_pos:
-                occupied.discard(unit_pos)
-                occupied.add(new_pos)
+            occupied.add(new_pos)
         actions.append(EndTurnAction())
         return actions
 
     # ── Build tactical context ──
     danger_map = build_danger_map(game_state, enemies)
+    # Enemies don't move during our turn, so their centre is fixed for the whole plan
+    enemy_center = (
+        sum(e.x for e in enemies) / len(enemies),
+        sum(e.y for e in enemies) / len(enemies),
+    )
 
     if strat.name == "Assassin":
         focus_order = _assign_assassin_targets(enemies, game_state)
@@ -193,10 +237,8 @@ def plan_turn(game_state: GameState, player_id: int, strategy_override: str = No
     n_flankers = int(len(infantry) * strat.flank_ratio)
     # Flankers: furthest from enemies, closest to enemy HQ flank routes
     if n_flankers > 0 and enemy_hq:
-        infantry.sort(key=lambda u: -manhattan((u.x, u.y), (
-            sum(e.x for e in enemies) / len(enemies),
-            sum(e.y for e in enemies) / len(enemies),
-        )))
+        ecx, ecy = enemy_center
+        infantry.sort(key=lambda u: -(abs(u.x - ecx) + abs(u.y - ecy)))
         flankers = infantry[:n_flankers]
         infantry = infantry[n_flankers:]
 
@@ -210,14 +252,14 @@ def plan_turn(game_state: GameState, player_id: int, strategy_override: str = No
     remaining = infantry + others
 
     # Triage: retreat vs attack
+    # Retreat threshold: strategy controls how cautious we are
+    retreat_threshold = strat.retreat_threshold
     for unit in remaining:
-        upos = (unit.x, unit.y)
-        incoming = danger_map.get(upos, 0)
+        incoming = danger_map[unit.y * 20 + unit.x]
         max_hp = UNIT_HP[unit.unit_type]
-        # Retreat threshold: strategy controls how cautious we are
         hp_ratio = unit.hp / max_hp
         should_retreat = (
-            hp_ratio <= strat.retreat_threshold
+            hp_ratio <= retreat_threshold
             and incoming > 0
             and unit.hp <= incoming
             and unit.hp < max_hp  # don't retreat at full HP
@@ -230,55 +272,54 @@ def plan_turn(game_state: GameState, player_id: int, strategy_override: str = No
     # ── Phase 1: Flankers sprint toward enemy HQ ──
     for unit in flankers:
         unit_pos = (unit.x, unit.y)
+        occupied.discard(unit_pos)  # a unit never blocks its own move
         a, new_pos = _plan_flanker(unit, unit_pos, enemy_hq, enemies,
                                      game_state, occupied, danger_map, strat)
         actions.extend(a)
-        if new_pos != unit_pos:
-            occupied.discard(unit_pos)
-            occupied.add(new_pos)
+        occupied.add(new_pos)
 
     # ── Phase 2: Retreat damaged units ──
     for unit in retreaters:
         unit_pos = (unit.x, unit.y)
-        a, new_pos = _plan_retreat(unit, unit_pos, enemies, danger_map,
+        occupied.discard(unit_pos)  # a unit never blocks its own move
+        a, new_pos = _plan_retreat(unit, unit_pos, enemy_center, danger_map,
                                     game_state, occupied, my_hq, strat)
         actions.extend(a)
-        if new_pos != unit_pos:
-            occupied.discard(unit_pos)
-            occupied.add(new_pos)
+        occupied.add(new_pos)
 
     # ── Phase 3: Screeners position between enemies and rangers ──
+    my_rangers = [u for u in my_units if u.unit_type == RANGER]  # my_units is alive-only
     for unit in screeners:
         unit_pos = (unit.x, unit.y)
-        a, new_pos = _plan_screener(unit, unit_pos, enemies, my_units,
+        occupied.discard(unit_pos)  # a unit never blocks its own move
+        a, new_pos = _plan_screener(unit, unit_pos, enemies, my_rangers,
                                       game_state, occupied, already_targeted, danger_map, strat)
         actions.extend(a)
-        if new_pos != unit_pos:
-            occupied.discard(unit_pos)
-            occupied.add(new_pos)
+        occupied.add(new_pos)
 
     # ── Phase 4: Main combat force ──
     if focus_order:
         ft = focus_order[0]
-        ft_pos = (ft.x, ft.y)
-        attackers.sort(key=lambda u: manhattan((u.x, u.y), ft_pos))
+        fx, fy = ft.x, ft.y
+        attackers.sort(key=lambda u: abs(u.x - fx) + abs(u.y - fy))
 
     for unit in attackers:
         unit_pos = (unit.x, unit.y)
+        occupied.discard(unit_pos)  # a unit never blocks its own move
         a, new_pos = _plan_combat_unit(
             unit, unit_pos, enemies, focus_order,
             game_state, occupied, already_targeted, danger_map, strat,
         )
         actions.extend(a)
-        if new_pos != unit_pos:
-            occupied.discard(unit_pos)
-            occupied.add(new_pos)
+        occupied.add(new_pos)
 
     actions.append(EndTurnAction())
     return actions
 
 
 # ── Role-specific planners ─────────────────────────────────────────
+# `occupied` is passed without the acting unit's own tile (plan_turn lifts
+# it out and adds back wherever the unit ends up), so no per-call set copy.
 
 def _plan_flanker(unit, unit_pos, enemy_hq, enemies, game_state, occupied, danger_map, strat):
     """Flanker: sprint toward enemy HQ, avoiding enemies when possible."""
@@ -290,97 +331,94 @@ def _plan_flanker(unit, unit_pos, enemy_hq, enemies, game_state, occupied, dange
     # On HQ? Capture!
     if unit_pos == enemy_hq and unit.unit_type in (INFANTRY, RANGER):
         actions.append(CaptureAction(unit.unit_id))
-        log.info(f"  🏴 Flanker #{unit.unit_id} CAPTURING HQ!")
+        log.info("  🏴 Flanker #%s CAPTURING HQ!", unit.unit_id)
         return actions, unit_pos
 
-    occ = occupied - {unit_pos}
-    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occ)
+    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occupied)
 
     # Score tiles: progress toward HQ, but penalize high danger
-    true_dist = full_path_distance(game_state.grid, (0, 0), enemy_hq, unit.unit_type)
+    grid = game_state.grid
+    dist_to_hq = full_path_distance(grid, (0, 0), enemy_hq, unit.unit_type).get
     best_tile = None
     best_score = float('inf')
 
-    for tile, (cost, path) in reachable.items():
-        if not path:
+    for tile in reachable:
+        if tile == unit_pos:
             continue
-        d = true_dist.get(tile, float('inf'))
-        tile_danger = danger_map.get(tile, 0)
-        terrain = game_state.grid[tile[1]][tile[0]]
-        defense = TERRAIN_DEFENSE.get(terrain, 0)
+        d = dist_to_hq(tile)
+        if d is None:
+            continue  # no route to HQ scores inf, which never wins
+        x, y = tile
         # Flankers value progress highly, danger somewhat
-        score = d * 2.0 + (tile_danger - defense) * 0.5
+        score = d * 2.0 + (danger_map[y * 20 + x] - TERRAIN_DEFENSE_LUT[grid[y][x]]) * 0.5
         if score < best_score:
             best_score = score
-            best_tile = (tile, path)
+            best_tile = tile
 
-    if best_tile and best_tile[0] != unit_pos:
-        tile, path = best_tile
-        actions.append(MoveAction(unit.unit_id, path))
-        new_pos = tile
+    if best_tile and best_tile != unit_pos:
+        actions.append(MoveAction(unit.unit_id, path_to(reachable, best_tile)))
+        new_pos = best_tile
         # Capture if we landed on HQ
         if new_pos == enemy_hq and unit.unit_type in (INFANTRY, RANGER):
             actions.append(CaptureAction(unit.unit_id))
-            log.info(f"  🏴 Flanker #{unit.unit_id} reaches HQ {unit_pos}->{new_pos}, capturing!")
+            log.info("  🏴 Flanker #%s reaches HQ %s->%s, capturing!", unit.unit_id, unit_pos, new_pos)
         else:
-            log.info(f"  🏴 Flanker #{unit.unit_id} sprints {unit_pos}->{new_pos} toward HQ")
+            log.info("  🏴 Flanker #%s sprints %s->%s toward HQ", unit.unit_id, unit_pos, new_pos)
         return actions, new_pos
 
-    log.info(f"  🏴 Flanker #{unit.unit_id} stuck at {unit_pos}")
+    log.info("  🏴 Flanker #%s stuck at %s", unit.unit_id, unit_pos)
     return actions, unit_pos
 
 
-def _plan_retreat(unit, unit_pos, enemies, danger_map, game_state, occupied, my_hq, strat):
+def _plan_retreat(unit, unit_pos, enemy_center, danger_map, game_state, occupied, my_hq, strat):
     """Move unit to safest reachable tile. Turtle strategy retreats toward own HQ."""
     actions = []
-    occ = occupied - {unit_pos}
-    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occ)
+    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occupied)
 
-    enemy_center = (
-        sum(e.x for e in enemies) / len(enemies),
-        sum(e.y for e in enemies) / len(enemies),
-    )
-    best_tile = unit_pos
-    best_score = _retreat_score(unit_pos, danger_map, game_state, enemy_center, my_hq, strat)
+    # Score = danger - defense * terrain_weight, then turtles add distance to
+    # own HQ and everyone else subtracts distance from the enemy centre.
+    # Lower is better; per-call invariants are resolved before the tile loop.
+    grid = game_state.grid
+    terrain_weight = strat.terrain_weight
+    turtle = bool(my_hq) and strat.aggression < 0.3
+    ax, ay = my_hq if turtle else (int(enemy_center[0]), int(enemy_center[1]))
+
+    # Best score any tile could reach (no danger, best terrain, and on own HQ or
+    # as far from the enemy as one move gets) — once hit, nothing can beat it
+    if turtle:
+        floor = -_MAX_DEFENSE * terrain_weight
+    else:
+        max_dist = abs(unit_pos[0] - ax) + abs(unit_pos[1] - ay) + MOVE_RANGE[unit.unit_type]
+        floor = -_MAX_DEFENSE * terrain_weight - max_dist * 0.3
 
-    for tile, (cost, path) in reachable.items():
-        if not path:
-            continue
-        score = _retreat_score(tile, danger_map, game_state, enemy_center, my_hq, strat)
+    # reachable yields the start tile first, so holding wins ties as before
+    best_tile = unit_pos
+    best_score = float('inf')
+    for tile in reachable:
+        x, y = tile
+        score = danger_map[y * 20 + x] - TERRAIN_DEFENSE_LUT[grid[y][x]] * terrain_weight
+        if turtle:
+            score += (abs(x - ax) + abs(y - ay)) * 0.5
+        else:
+            score -= (abs(x - ax) + abs(y - ay)) * 0.3
         if score < best_score:
             best_score = score
             best_tile = tile
+            if score <= floor:
+                break
 
     if best_tile != unit_pos:
-        path = reachable[best_tile][1]
-        actions.append(MoveAction(unit.unit_id, path))
-        log.info(f"  🚑 #{unit.unit_id} RETREATS {unit_pos}->{best_tile} "
-                 f"(hp={unit.hp}, danger={danger_map.get(unit_pos,0)}->{danger_map.get(best_tile,0)})")
+        actions.append(MoveAction(unit.unit_id, path_to(reachable, best_tile)))
+        log.info("  🚑 #%s RETREATS %s->%s (hp=%s, danger=%s->%s)",
+                 unit.unit_id, unit_pos, best_tile, unit.hp,
+                 danger_map[unit_pos[1] * 20 + unit_pos[0]], danger_map[best_tile[1] * 20 + best_tile[0]])
     else:
-        log.info(f"  🚑 #{unit.unit_id} holds (nowhere safer, hp={unit.hp})")
+        log.info("  🚑 #%s holds (nowhere safer, hp=%s)", unit.unit_id, unit.hp)
 
     return actions, best_tile
 
 
-def _retreat_score(tile, danger_map, game_state, enemy_center, my_hq, strat):
-    """Lower is better. Combines danger, terrain defense, distance from enemies."""
-    d = danger_map.get(tile, 0)
-    terrain = game_state.grid[tile[1]][tile[0]]
-    defense = TERRAIN_DEFENSE.get(terrain, 0)
-    dist_enemy = manhattan(tile, (int(enemy_center[0]), int(enemy_center[1])))
-
-    score = d - defense * strat.terrain_weight
-    # Turtle: value being near own HQ
-    if my_hq and strat.aggression < 0.3:
-        dist_hq = manhattan(tile, my_hq)
-        score += dist_hq * 0.5
-    else:
-        score -= dist_enemy * 0.3
-
-    return score
-
-
-def _plan_screener(unit, unit_pos, enemies, my_units, game_state, occupied,
+def _plan_screener(unit, unit_pos, enemies, rangers, game_state, occupied,
                     already_targeted, danger_map, strat):
     """
     Screener: position between enemies and our high-value units (rangers).
@@ -393,27 +431,26 @@ def _plan_screener(unit, unit_pos, enemies, my_units, game_state, occupied,
     if target:
         actions.append(AttackAction(unit.unit_id, target.unit_id))
         _record_attack(unit, target, game_state, already_targeted)
-        log.info(f"  🛡️ Screen #{unit.unit_id} attacks #{target.unit_id}")
+        log.info("  🛡️ Screen #%s attacks #%s", unit.unit_id, target.unit_id)
         return actions, unit_pos
 
-    # Find our rangers to protect
-    rangers = [u for u in my_units if u.unit_type == RANGER and u.is_alive]
+    # Rangers to protect
     if not rangers:
         # No rangers — just act as normal melee
         return _plan_melee(unit, unit_pos, enemies, enemies, game_state, occupied,
                            already_targeted, danger_map, strat)
 
     # Position between nearest enemy and nearest ranger
-    nearest_enemy = min(enemies, key=lambda e: manhattan(unit_pos, (e.x, e.y)))
-    nearest_ranger = min(rangers, key=lambda r: manhattan(unit_pos, (r.x, r.y)))
+    ux, uy = unit_pos
+    nearest_enemy = min(enemies, key=lambda e: abs(ux - e.x) + abs(uy - e.y))
+    nearest_ranger = min(rangers, key=lambda r: abs(ux - r.x) + abs(uy - r.y))
 
     # Target tile: midpoint between enemy and ranger, biased toward enemy
     ex, ey = nearest_enemy.x, nearest_enemy.y
     rx, ry = nearest_ranger.x, nearest_ranger.y
     intercept = (int(ex * 0.6 + rx * 0.4), int(ey * 0.6 + ry * 0.4))
 
-    occ = occupied - {unit_pos}
-    path = best_move_toward(game_state.grid, unit_pos, intercept, unit.unit_type, occ)
+    path = best_move_toward(game_state.grid, unit_pos, intercept, unit.unit_type, occupied)
     if path:
         actions.append(MoveAction(unit.unit_id, path))
         new_pos = path[-1]
@@ -422,12 +459,12 @@ def _plan_screener(unit, unit_pos, enemies, my_units, game_state, occupied,
         if target:
             actions.append(AttackAction(unit.unit_id, target.unit_id))
             _record_attack(unit, target, game_state, already_targeted)
-            log.info(f"  🛡️ Screen #{unit.unit_id} intercepts {unit_pos}->{new_pos}, attacks #{target.unit_id}")
+            log.info("  🛡️ Screen #%s intercepts %s->%s, attacks #%s", unit.unit_id, unit_pos, new_pos, target.unit_id)
         else:
-            log.info(f"  🛡️ Screen #{unit.unit_id} positions {unit_pos}->{new_pos}")
+            log.info("  🛡️ Screen #%s positions %s->%s", unit.unit_id, unit_pos, new_pos)
         return actions, new_pos
 
-    log.info(f"  🛡️ Screen #{unit.unit_id} holds at {unit_pos}")
+    log.info("  🛡️ Screen #%s holds at %s", unit.unit_id, unit_pos)
     return actions, unit_pos
 
 
@@ -456,48 +493,57 @@ def _plan_ranger(unit, unit_pos, enemies, focus_order, game_state,
     if target:
         actions.append(AttackAction(unit.unit_id, target.unit_id))
         _record_attack(unit, target, game_state, already_targeted)
-        log.info(f"  🎯 Ranger #{unit.unit_id} snipes #{target.unit_id} from {unit_pos}")
+        log.info("  🎯 Ranger #%s snipes #%s from %s", unit.unit_id, target.unit_id, unit_pos)
         return actions, new_pos
 
     # Reposition: find best sniping tile
     primary = focus_order[0] if focus_order else enemies[0]
     primary_pos = (primary.x, primary.y)
 
-    occ = occupied - {unit_pos}
-    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occ)
+    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occupied)
 
+    # Ranked by (out of range, tile danger, distance), compared field by field
+    # instead of building a tuple per tile; once an in-range tile is found,
+    # out-of-range tiles are skipped before any scoring
+    grid = game_state.grid
+    terrain_weight = strat.terrain_weight
+    px, py = primary_pos
+    min_r, max_r = ATTACK_RANGE_NORM[RANGER]
     best_tile = None
-    best_score = (float('inf'),)
-    a_range = ATTACK_RANGE[RANGER]
+    best_in_range = False
+    best_danger = best_d = float('inf')
 
-    for tile, (cost, path) in reachable.items():
-        if not path:
+    for tile in reachable:
+        if tile == unit_pos:
+            continue
+        x, y = tile
+        d = abs(x - px) + abs(y - py)
+        in_range = min_r <= d <= max_r
+        if best_in_range and not in_range:
             continue
-        d = manhattan(tile, primary_pos)
-        in_range = a_range[0] <= d <= a_range[1]
-        terrain = game_state.grid[tile[1]][tile[0]]
-        defense = TERRAIN_DEFENSE.get(terrain, 0)
-        tile_danger = danger_map.get(tile, 0) - defense * strat.terrain_weight
+        tile_danger = danger_map[y * 20 + x] - TERRAIN_DEFENSE_LUT[grid[y][x]] * terrain_weight
 
-        score = (0 if in_range else 1, tile_danger, d)
-        if score < best_score:
-            best_score = score
-            best_tile = (tile, path)
+        if (in_range and not best_in_range) or tile_danger < best_danger or (
+                tile_danger == best_danger and d < best_d):
+            best_in_range = in_range
+            best_danger = tile_danger
+            best_d = d
+            best_tile = tile
 
-    if best_tile and best_tile[0] != unit_pos:
-        tile, path = best_tile
-        actions.append(MoveAction(unit.unit_id, path))
-        new_pos = tile
+    if best_tile and best_tile != unit_pos:
+        actions.append(MoveAction(unit.unit_id, path_to(reachable, best_tile)))
+        new_pos = best_tile
         # Rangers can NOT attack after moving — just reposition
-        log.info(f"  🎯 Ranger #{unit.unit_id} kites {unit_pos}->{new_pos}")
+        log.info("  🎯 Ranger #%s kites %s->%s", unit.unit_id, unit_pos, new_pos)
     else:
-        path = best_move_toward(game_state.grid, unit_pos, primary_pos, unit.unit_type, occ)
+        path = best_move_toward(game_state.grid, unit_pos, primary_pos, unit.unit_type, occupied,
+                                reachable)
         if path:
             actions.append(MoveAction(unit.unit_id, path))
             new_pos = path[-1]
-            log.info(f"  🎯 Ranger #{unit.unit_id} advances {unit_pos}->{new_pos}")
+            log.info("  🎯 Ranger #%s advances %s->%s", unit.unit_id, unit_pos, new_pos)
         else:
-            log.info(f"  🎯 Ranger #{unit.unit_id} stuck at {unit_pos}")
+            log.info("  🎯 Ranger #%s stuck at %s", unit.unit_id, unit_pos)
 
     return actions, new_pos
 
@@ -516,24 +562,24 @@ def _plan_melee(unit, unit_pos, enemies, focus_order, game_state,
     if target:
         actions.append(AttackAction(unit.unit_id, target.unit_id))
         _record_attack(unit, target, game_state, already_targeted)
-        log.info(f"  ⚔️ {unit.unit_type} #{unit.unit_id} attacks #{target.unit_id} at {unit_pos}")
+        log.info("  ⚔️ %s #%s attacks #%s at %s", unit.unit_type, unit.unit_id, target.unit_id, unit_pos)
         return actions, new_pos
 
     # Turtle: don't advance if we're on good terrain and aggression is low
     if strat.aggression < 0.3:
         terrain = game_state.grid[unit_pos[1]][unit_pos[0]]
-        defense = TERRAIN_DEFENSE.get(terrain, 0)
+        defense = TERRAIN_DEFENSE_LUT[terrain]
         if defense >= 1:
-            log.info(f"  🐢 {unit.unit_type} #{unit.unit_id} holds {unit_pos} (def={defense}, turtle)")
+            log.info("  🐢 %s #%s holds %s (def=%s, turtle)", unit.unit_type, unit.unit_id, unit_pos, defense)
             return actions, unit_pos
 
     # Advance toward focus target
     primary = focus_order[0] if focus_order else enemies[0]
     primary_pos = (primary.x, primary.y)
-    occ = occupied - {unit_pos}
 
-    # Try to reach adjacent to target
-    path = find_adjacent_to(game_state.grid, primary_pos, unit.unit_type, unit_pos, occ)
+    # Try to reach adjacent to target (the search is shared with the fallback below)
+    reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occupied)
+    path = find_adjacent_to(game_state.grid, primary_pos, unit.unit_type, unit_pos, occupied, reachable)
     if path:
         actions.append(MoveAction(unit.unit_id, path))
         new_pos = path[-1]
@@ -541,83 +587,74 @@ def _plan_melee(unit, unit_pos, enemies, focus_order, game_state,
         if target:
             actions.append(AttackAction(unit.unit_id, target.unit_id))
             _record_attack(unit, target, game_state, already_targeted)
-            log.info(f"  ⚔️ {unit.unit_type} #{unit.unit_id} charges {unit_pos}->{new_pos}, attacks #{target.unit_id}")
+            log.info("  ⚔️ %s #%s charges %s->%s, attacks #%s", unit.unit_type, unit.unit_id, unit_pos, new_pos, target.unit_id)
         else:
-            log.info(f"  ⚔️ {unit.unit_type} #{unit.unit_id} advances {unit_pos}->{new_pos}")
+            log.info("  ⚔️ %s #%s advances %s->%s", unit.unit_type, unit.unit_id, unit_pos, new_pos)
     else:
         # Can't reach adjacent — pick best advance tile
-        reachable = find_reachable(game_state.grid, unit_pos, unit.unit_type, occ)
-        result = _best_advance_tile(reachable, primary_pos, game_state, danger_map, unit.unit_type, strat)
-        if result:
-            tile, r_path = result
-            actions.append(MoveAction(unit.unit_id, r_path))
+        tile = _best_advance_tile(reachable, unit_pos, primary_pos, game_state, danger_map, unit.unit_type, strat)
+        if tile:
+            actions.append(MoveAction(unit.unit_id, path_to(reachable, tile)))
             new_pos = tile
-            log.info(f"  ⚔️ {unit.unit_type} #{unit.unit_id} advances {unit_pos}->{new_pos}")
+            log.info("  ⚔️ %s #%s advances %s->%s", unit.unit_type, unit.unit_id, unit_pos, new_pos)
         else:
-            log.info(f"  ⚔️ {unit.unit_type} #{unit.unit_id} stuck at {unit_pos}")
+            log.info("  ⚔️ %s #%s stuck at %s", unit.unit_type, unit.unit_id, unit_pos)
 
     return actions, new_pos
 
 
-def _best_advance_tile(reachable, goal_pos, game_state, danger_map, unit_type, strat):
-    """Pick reachable tile balancing progress, safety, and terrain defense."""
+def _best_advance_tile(reachable, unit_pos, goal_pos, game_state, danger_map, unit_type, strat):
+    """Pick reachable tile balancing progress, safety, and terrain defense. Returns the tile or None."""
     grid = game_state.grid
-    true_dist = full_path_distance(grid, (0, 0), goal_pos, unit_type)
+    dist_to_goal = full_path_distance(grid, (0, 0), goal_pos, unit_type).get
+
+    # Strategy shapes the scoring; the weights are fixed for the whole scan
+    dist_weight = 2.0 - strat.aggression               # aggressive = care less about distance
+    terrain_weight = strat.terrain_weight              # terrain lovers value defense more
+    danger_weight = 0.5 - strat.aggression * 0.3       # aggressive = ignore danger
 
     best = None
     best_score = float('inf')
-    for tile, (cost, path) in reachable.items():
-        if not path:
+    for tile in reachable:
+        if tile == unit_pos:
             continue
-        d = true_dist.get(tile, float('inf'))
-        if d == float('inf'):
+        d = dist_to_goal(tile)
+        if d is None:
             continue
-        terrain = grid[tile[1]][tile[0]]
-        defense = TERRAIN_DEFENSE.get(terrain, 0)
-        tile_danger = danger_map.get(tile, 0)
-        # Strategy shapes the scoring
-        score = (d * (2.0 - strat.aggression)          # aggressive = care less about distance
-                 - defense * strat.terrain_weight        # terrain lovers value defense more
-                 + tile_danger * (0.5 - strat.aggression * 0.3))  # aggressive = ignore danger
+        x, y = tile
+        score = (d * dist_weight
+                 - TERRAIN_DEFENSE_LUT[grid[y][x]] * terrain_weight
+                 + danger_map[y * 20 + x] * danger_weight)
         if score < best_score:
             best_score = score
-            best = (tile, path)
+            best = tile
     return best
 
 
 # ── Shared helpers ─────────────────────────────────────────────────
 
 def in_attack_range(unit_type: str, attacker_pos: tuple, target_pos: tuple) -> bool:
-    dist = manhattan(attacker_pos, target_pos)
-    r = ATTACK_RANGE[unit_type]
-    if isinstance(r, tuple):
-        return r[0] <= dist <= r[1]
-    return dist == r
+    min_r, max_r = ATTACK_RANGE_NORM[unit_type]
+    return min_r <= manhattan(attacker_pos, target_pos) <= max_r
 
 
 def _pick_focus_target_in_range(unit, unit_pos, targets, game_state, already_targeted, strat):
-    """Pick the highest-priority target in attack range."""
+    """Pick the highest-priority target in attack range. targets must be alive units."""
+    # Range test first — a cheap distance check before the already_targeted lookup
+    min_r, max_r = ATTACK_RANGE_NORM[unit.unit_type]
+    ux, uy = unit_pos
     for target in targets:
-        if not target.is_alive:
+        if not min_r <= abs(target.x - ux) + abs(target.y - uy) <= max_r:
             continue
         prior_dmg = already_targeted.get(target.unit_id, 0)
         if target.hp <= prior_dmg:
             continue
-        if in_attack_range(unit.unit_type, unit_pos, (target.x, target.y)):
-            return target
-
-    # If no focus target in range, check any enemy in range (opportunistic)
-    if strat.focus_fire < 0.8:
-        enemies = [t for t in targets]  # already the full list
-        for e in game_state.enemy_units(0):  # fallback
-            pass
+        return target
     return None
 
 
 def _record_attack(unit, target, game_state, already_targeted):
-    terrain = game_state.grid[target.y][target.x]
-    defense = TERRAIN_DEFENSE.get(terrain, 0)
-    dmg = max(UNIT_ATK[unit.unit_type] - defense, 1)
+    dmg = _damage_table(game_state.grid, unit.unit_type)[target.y * 20 + target.x]
     already_targeted[target.unit_id] = already_targeted.get(target.unit_id, 0) + dmg
 
 
@@ -630,22 +667,21 @@ def _plan_capture_march(unit, unit_pos, enemy_hq, game_state, occupied):
     if unit_pos == enemy_hq:
         if unit.unit_type in (INFANTRY, RANGER):
             actions.append(CaptureAction(unit.unit_id))
-            log.info(f"  #{unit.unit_id} CAPTURING HQ at {enemy_hq}!")
+            log.info("  #%s CAPTURING HQ at %s!", unit.unit_id, enemy_hq)
         else:
-            log.info(f"  Tank #{unit.unit_id} on HQ but can't capture, waiting")
+            log.info("  Tank #%s on HQ but can't capture, waiting", unit.unit_id)
         return actions, new_pos
 
-    occ = occupied - {unit_pos}
-    path = best_move_toward(game_state.grid, unit_pos, enemy_hq, unit.unit_type, occ)
+    path = best_move_toward(game_state.grid, unit_pos, enemy_hq, unit.unit_type, occupied)
     if path:
         actions.append(MoveAction(unit.unit_id, path))
         new_pos = path[-1]
         if new_pos == enemy_hq and unit.unit_type in (INFANTRY, RANGER):
             actions.append(CaptureAction(unit.unit_id))
-            log.info(f"  #{unit.unit_id} reached HQ {enemy_hq}, capturing!")
+            log.info("  #%s reached HQ %s, capturing!", unit.unit_id, enemy_hq)
         else:
-            log.info(f"  #{unit.unit_id} marching toward HQ: {unit_pos}->{new_pos}")
+            log.info("  #%s marching toward HQ: %s->%s", unit.unit_id, unit_pos, new_pos)
     else:
-        log.info(f"  #{unit.unit_id} stuck marching to HQ from {unit_pos}")
+        log.info("  #%s stuck marching to HQ from %s", unit.unit_id, unit_pos)
 
     return actions, new_pos
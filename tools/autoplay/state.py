@@ -1,8 +1,10 @@
 """Game state reading from Torii GraphQL."""
 
+import http.client
 import json
-import urllib.request
 import logging
+import threading
+import urllib.parse
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -11,7 +13,7 @@ from config import TORII_URL, TERRAIN_NAME_MAP, TERRAIN_GRASS
 log = logging.getLogger("state")
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     unit_id: int
     player_id: int
@@ -24,7 +26,7 @@ class Unit:
     last_acted_round: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Building:
     x: int
     y: int
@@ -33,7 +35,7 @@ class Building:
     capture_progress: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GameInfo:
     game_id: int
     name: str
@@ -45,7 +47,7 @@ class GameInfo:
     player_count: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     info: GameInfo
     units: list  # List[Unit]
@@ -82,16 +84,46 @@ def fetch_game_turn(game_id: int) -> tuple:
     return (n["current_player"], n["round"], n["state"])
 
 
+_TORII = urllib.parse.urlsplit(TORII_URL)
+_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive connection per thread (http.client connections aren't thread-safe),
+# so repeated polls reuse the TCP+TLS session instead of reconnecting each call
+_local = threading.local()
+
+
+def _torii_connection() -> http.client.HTTPConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn_cls = http.client.HTTPSConnection if _TORII.scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(_TORII.netloc, timeout=15)
+        _local.conn = conn
+    return conn
+
+
 def graphql(query: str) -> dict:
     """Execute a GraphQL query against Torii."""
     data = json.dumps({"query": query}).encode("utf-8")
-    req = urllib.request.Request(
-        TORII_URL,
-        data=data,
-        headers={"Content-Type": "application/json"},
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read())
+    for attempt in range(2):
+        conn = _torii_connection()
+        try:
+            conn.request("POST", _TORII.path or "/", body=data, headers=_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # Server dropped the idle keep-alive connection — reconnect once
+            conn.close()
+            _local.conn = None
+            if attempt:
+                raise
+            continue
+        except Exception:
+            conn.close()
+            _local.conn = None
+            raise
+        if resp.status >= 400:
+            raise http.client.HTTPException(f"Torii returned HTTP {resp.status}")
+        return json.loads(body)
 
 
 # Cache map terrain per map_id
@@ -106,12 +138,14 @@ def fetch_terrain(map_id: int, width: int = 20, height: int = 20) -> list:
     # Initialize all grass
     grid = [[TERRAIN_GRASS] * width for _ in range(height)]
 
-    # Fetch non-grass tiles (paginated)
+    # Fetch non-grass tiles. A page holds the whole board, so this is one
+    # round trip; the cursor loop stays as a guard against server-side caps.
+    page_size = width * height
     cursor = None
     while True:
         after = f', after: "{cursor}"' if cursor else ""
         result = graphql(f"""{{
-            hashfrontMapTileModels(where: {{map_idEQ: {map_id}}}, first: 200{after}) {{
+            hashfrontMapTileModels(where: {{map_idEQ: {map_id}}}, first: {page_size}{after}) {{
                 totalCount
                 pageInfo {{ hasNextPage endCursor }}
                 edges {{ node {{ x y tile_type }} }}
@@ -211,6 +245,25 @@ def fetch_player_states(game_id: int) -> list:
     return players
 
 
+def fetch_player_states_batch(game_ids: list) -> dict:
+    """Fetch player states for several games in one aliased query.
+    Returns {game_id: [(player_id, address), ...]}."""
+    if not game_ids:
+        return {}
+    fields = " ".join(
+        'g%d: hashfrontPlayerStateModels(where:{game_idEQ:%d}, first:10){edges{node{player_id address}}}' % (gid, gid)
+        for gid in game_ids
+    )
+    result = graphql("{%s}" % fields)
+    states = {}
+    for gid in game_ids:
+        states[gid] = [
+            (edge["node"]["player_id"], edge["node"]["address"])
+            for edge in result["data"]["g%d" % gid]["edges"]
+        ]
+    return states
+
+
 def fetch_map_ids() -> list:
     """Fetch all available map IDs, deduped by name (keeps highest map_id per name)."""
     result = graphql("""{
@@ -245,7 +298,3 @@ def fetch_all_games() -> list:
         ))
     return games
 
-
-def fetch_active_games() -> list:
-    """List all games in Playing state."""
-    return [g for g in fetch_all_games() if g.state == "Playing"]
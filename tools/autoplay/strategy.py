@@ -4,10 +4,12 @@ import random
 import logging
 from dataclasses import dataclass, field
 
+from config import INFANTRY, RANGER, TANK
+
 log = logging.getLogger("strategy")
 
 
-@dataclass
+@dataclass(slots=True)
 class Strategy:
     """Weights that control planner behavior. All values 0.0–1.0 unless noted."""
     name: str
@@ -119,6 +121,12 @@ STRATEGY_WEIGHTS = {
     "Assassin": 1,
 }
 
+# Expanded once: each strategy repeated by its weight. pick_strategy draws from
+# this exact sequence, so seeded picks stay the same as building it per call.
+_STRATEGY_POOL = tuple(
+    s for s in ALL_STRATEGIES for _ in range(STRATEGY_WEIGHTS.get(s.name, 1))
+)
+
 
 def pick_strategy(game_id: int = 0, player_id: int = 0) -> Strategy:
     """
@@ -128,12 +136,8 @@ def pick_strategy(game_id: int = 0, player_id: int = 0) -> Strategy:
     """
     # Seeded RNG so same game+player always gets same strategy
     rng = random.Random(game_id * 10 + player_id)
-    pool = []
-    for s in ALL_STRATEGIES:
-        weight = STRATEGY_WEIGHTS.get(s.name, 1)
-        pool.extend([s] * weight)
-    choice = rng.choice(pool)
-    log.info(f"G{game_id} P{player_id}: Strategy → {choice.name} ({choice.description})")
+    choice = rng.choice(_STRATEGY_POOL)
+    log.info("G%s P%s: Strategy → %s (%s)", game_id, player_id, choice.name, choice.description)
     return choice
 
 
@@ -142,8 +146,6 @@ def pick_strategy_adaptive(game_state, player_id: int) -> Strategy:
     Pick strategy based on game state. Mixes RNG with situational awareness.
     Overrides the random pick when game state strongly suggests a strategy.
     """
-    from config import UNIT_ATK, INFANTRY, RANGER, TANK
-
     my_units = game_state.alive_units(player_id)
     enemies = game_state.enemy_units(player_id)
     rnd = game_state.info.round